@@ -2,124 +2,36 @@
 Digital glyph fall effect component for The Basilisk Protocol.
 """
 
-import random
+import numpy as np
 import pygame
-from typing import List
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 from utils.game_config import MatrixConfig, Colors, FontConfig
+from utils.render_utils import blit_batch
 
 
-@dataclass
-class GlyphTrail:
-    """Represents a single falling glyph in a data stream."""
-    y: float
-    char: str
-    age: int
-
-
-class DataStream:
-    """
-    Manages a single vertical stream of falling glyphs.
-
-    Each stream has its own behavior to simulate an organic,
-    AI-generated visualization or memory leak.
-    """
-
-    def __init__(self, x: int) -> None:
-        """
-        Initialize a data stream at the given x-coordinate.
-
-        Args:
-            x: The horizontal position of this stream
-        """
-        self.x = x
-        self.characters: List[GlyphTrail] = []
-        self.speed = random.randint(MatrixConfig.MIN_SPEED, MatrixConfig.MAX_SPEED)
-        self.spawn_chance = random.uniform(
-            MatrixConfig.MIN_SPAWN_CHANCE, 
-            MatrixConfig.MAX_SPAWN_CHANCE
-        )
-
-    def update(self) -> None:
-        """Update the stream's glyphs for one frame."""
-        self._spawn_new_character()
-        self._update_existing_characters()
-        self._remove_old_characters()
-
-    def _spawn_new_character(self) -> None:
-        """Randomly generate a new glyph at the top of the stream."""
-        can_spawn = (
-            random.random() < self.spawn_chance and 
-            len(self.characters) < MatrixConfig.MAX_CHARS_PER_STREAM
-        )
-
-        if can_spawn:
-            new_char = GlyphTrail(
-                y=-FontConfig.STREAM_FONT_SIZE,
-                char=random.choice(MatrixConfig.CHARACTER_SET),
-                age=0
-            )
-            self.characters.append(new_char)
-
-    def _update_existing_characters(self) -> None:
-        """Update position and behavior of falling glyphs."""
-        for char in self.characters:
-            char.y += self.speed
-            char.age += 1
-
-            # Flicker / mutation simulation
-            if random.random() < MatrixConfig.FLICKER_CHANCE:
-                char.char = random.choice(MatrixConfig.CHARACTER_SET)
-
-    def _remove_old_characters(self) -> None:
-        """Remove glyphs that fall outside the visible screen."""
-        screen_bottom = pygame.display.get_surface().get_height()
-        max_y = screen_bottom + FontConfig.STREAM_FONT_SIZE
-        self.characters = [char for char in self.characters if char.y < max_y]
-
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
-        """
-        Render all glyphs in this stream onto the display.
-
-        Args:
-            surface: The surface to draw on
-            font: The font used to render glyphs
-        """
-        for i, char in enumerate(self.characters):
-            if self._is_character_visible(char, surface.get_height()):
-                color, alpha = self._get_character_appearance(i)
-                text = font.render(char.char, True, color)
-                text.set_alpha(alpha)
-                surface.blit(text, (self.x, char.y))
-
-    def _is_character_visible(self, char: GlyphTrail, screen_height: int) -> bool:
-        """Check if a glyph is within the screen's visible range."""
-        return 0 <= char.y < screen_height
-
-    def _get_character_appearance(self, index: int) -> tuple:
-        """
-        Determine color and transparency for a glyph based on depth.
-
-        Args:
-            index: Index of the glyph in the stream
-        Returns:
-            Tuple of (color, alpha)
-        """
-        if index == 0:
-            return Colors.ICE_BLUE, 255
+def _build_appearance_table() -> List[Tuple[Tuple[int, int, int], int]]:
+    """Precompute the (color, alpha) pair for every slot of a stream."""
+    table = [(Colors.ICE_BLUE, 255)]
 
+    for index in range(1, MatrixConfig.MAX_CHARS_PER_STREAM):
         fade_factor = max(0, 1 - (index / MatrixConfig.FADE_LENGTH))
         alpha = int(255 * fade_factor)
 
-        color = (Colors.ICE_BLUE if index <= MatrixConfig.BRIGHT_HEAD_COUNT 
+        color = (Colors.ICE_BLUE if index <= MatrixConfig.BRIGHT_HEAD_COUNT
                  else Colors.DARK_ICE_BLUE)
+        table.append((color, alpha))
+
+    return table
+
 
-        return color, alpha
+_APPEARANCE_TABLE = _build_appearance_table()
 
-    def clear(self) -> None:
-        """Remove all glyphs from this stream."""
-        self.characters.clear()
+# Alpha only falls with depth, so glyphs past this slot are fully transparent
+_DRAWABLE_SLOTS = next(
+    (slot for slot, (_, alpha) in enumerate(_APPEARANCE_TABLE) if alpha == 0),
+    len(_APPEARANCE_TABLE)
+)
 
 
 class DataRainEffect:
@@ -128,6 +40,11 @@ class DataRainEffect:
 
     Simulates an AI's visual output, memory cascade, or signal leak
     across vertical trails of glyphs.
+
+    Glyph state is kept as a struct of NumPy arrays with one row per
+    stream and one column per trail slot (oldest glyph first), so a frame
+    is advanced with a few vectorized operations instead of a Python loop
+    over every glyph.
     """
 
     def __init__(self, screen_width: int, screen_height: int) -> None:
@@ -140,36 +57,221 @@ class DataRainEffect:
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.rng = np.random.default_rng()
         self._initialize_streams()
 
     def _initialize_streams(self) -> None:
         """Distribute glyph streams across the screen width."""
         stream_spacing = FontConfig.STREAM_FONT_SIZE
-        self.streams = [
-            DataStream(x) 
-            for x in range(0, self.screen_width, stream_spacing)
-        ]
+        self.stream_x = np.arange(0, self.screen_width, stream_spacing, dtype=np.int32)
+        num_streams = len(self.stream_x)
+        shape = (num_streams, MatrixConfig.MAX_CHARS_PER_STREAM)
+
+        # Per-stream behavior
+        self.speeds = self.rng.integers(
+            MatrixConfig.MIN_SPEED,
+            MatrixConfig.MAX_SPEED,
+            num_streams,
+            dtype=np.int32,
+            endpoint=True
+        )
+        self.spawn_chances = self.rng.uniform(
+            MatrixConfig.MIN_SPAWN_CHANCE,
+            MatrixConfig.MAX_SPAWN_CHANCE,
+            num_streams
+        )
+        self.counts = np.zeros(num_streams, dtype=np.int32)
+
+        # Per-glyph state; only the first counts[i] slots of row i are live
+        self.char_y = np.zeros(shape, dtype=np.int32)
+        self.char_idx = np.zeros(shape, dtype=np.uint8)
+        self._slots = np.arange(MatrixConfig.MAX_CHARS_PER_STREAM, dtype=np.int32)
+
+        # Scratch buffers reused every frame so the update step allocates nothing per glyph.
+        # One random draw per frame covers a flicker roll per visible slot plus
+        # a spawn roll per stream; hidden glyphs are uniformly random already,
+        # so flickering them would not change anything on screen
+        self._roll = np.empty((num_streams, _DRAWABLE_SLOTS + 1), dtype=np.float32)
+        self._flicker_roll = self._roll[:, :-1]
+        self._spawn_roll = self._roll[:, -1]
+        self._flicker = np.empty((num_streams, _DRAWABLE_SLOTS), dtype=bool)
+        self._on_screen = np.empty((num_streams, _DRAWABLE_SLOTS), dtype=bool)
+        self._in_bounds = np.empty((num_streams, _DRAWABLE_SLOTS), dtype=bool)
+
+        # Atlas index and (x, y) of every glyph to draw, refreshed by update()
+        self._visible_atlas_index: List[int] = []
+        self._visible_positions: List[Tuple[int, int]] = []
+
+        # Glyph indices are drawn in bulk and handed out by _sample_glyphs
+        self._glyph_pool = np.empty(0, dtype=np.uint8)
+        self._glyph_pool_pos = 0
+
+        # Pre-rendered glyphs per opacity, flattened as slot * len(CHARACTER_SET) + glyph
+        self._glyph_atlases: Dict[int, List[pygame.Surface]] = {}
+        self._glyph_atlas_font: Optional[pygame.font.Font] = None
 
     def update(self) -> None:
         """Advance all glyph streams by one frame."""
-        for stream in self.streams:
-            stream.update()
+        self.rng.random(out=self._roll, dtype=np.float32)
+        self._spawn_new_characters()
+        self._update_existing_characters()
+        self._remove_old_characters()
+        self._collect_visible_characters()
+
+    def _spawn_new_characters(self) -> None:
+        """Randomly generate a new glyph at the top of each stream."""
+        can_spawn = (
+            (self._spawn_roll < self.spawn_chances) &
+            (self.counts < MatrixConfig.MAX_CHARS_PER_STREAM)
+        )
+        rows = np.flatnonzero(can_spawn)
+
+        if rows.size:
+            slots = self.counts[rows]
+            self.char_y[rows, slots] = -FontConfig.STREAM_FONT_SIZE
+            self.char_idx[rows, slots] = self._sample_glyphs(rows.size)
+            self.counts[rows] += 1
+
+    def _update_existing_characters(self) -> None:
+        """Update position and behavior of falling glyphs."""
+        # Dead slots are advanced as well; they are never read back
+        np.add(self.char_y, self.speeds[:, np.newaxis], out=self.char_y)
+
+        # Flicker / mutation simulation
+        np.less(self._flicker_roll, MatrixConfig.FLICKER_CHANCE, out=self._flicker)
+        flickered = np.count_nonzero(self._flicker)
+        if flickered:
+            self.char_idx[:, :_DRAWABLE_SLOTS][self._flicker] = self._sample_glyphs(flickered)
+
+    def _sample_glyphs(self, count: int) -> np.ndarray:
+        """
+        Take random glyph indices from the pre-drawn pool.
+
+        Args:
+            count: Number of indices needed
+        Returns:
+            Array of indices into MatrixConfig.CHARACTER_SET
+        """
+        start = self._glyph_pool_pos
+        if start + count > len(self._glyph_pool):
+            self._glyph_pool = self.rng.integers(
+                0,
+                len(MatrixConfig.CHARACTER_SET),
+                max(count, MatrixConfig.GLYPH_POOL_SIZE),
+                dtype=np.uint8
+            )
+            start = 0
+
+        self._glyph_pool_pos = start + count
+        return self._glyph_pool[start:self._glyph_pool_pos]
 
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
+    def _remove_old_characters(self) -> None:
+        """Remove glyphs that fall outside the visible screen."""
+        max_y = self.screen_height + FontConfig.STREAM_FONT_SIZE
+
+        # A stream spawns at most one glyph per frame and moves them all by
+        # the same speed, so only its oldest glyph (slot 0) can expire
+        rows = np.flatnonzero((self.counts > 0) & (self.char_y[:, 0] >= max_y))
+
+        # Shift the affected rows down by one slot in place
+        for row, count in zip(rows.tolist(), self.counts[rows].tolist()):
+            for column in (self.char_y, self.char_idx):
+                column[row, :count - 1] = column[row, 1:count]
+        self.counts[rows] -= 1
+
+    def _collect_visible_characters(self) -> None:
+        """Gather the on-screen glyphs while this frame's arrays are hot."""
+        # Only the leading, non-transparent slots of each stream can be seen
+        ys = self.char_y[:, :_DRAWABLE_SLOTS]
+        np.less(
+            self._slots[:_DRAWABLE_SLOTS],
+            self.counts[:, np.newaxis],
+            out=self._on_screen
+        )
+        np.greater_equal(ys, 0, out=self._in_bounds)
+        np.logical_and(self._on_screen, self._in_bounds, out=self._on_screen)
+        np.less(ys, self.screen_height, out=self._in_bounds)
+        np.logical_and(self._on_screen, self._in_bounds, out=self._on_screen)
+        rows, slots = np.nonzero(self._on_screen)
+
+        self._visible_atlas_index = (
+            slots * len(MatrixConfig.CHARACTER_SET) + self.char_idx[rows, slots]
+        ).tolist()
+        self._visible_positions = list(zip(
+            self.stream_x[rows].tolist(),
+            self.char_y[rows, slots].tolist()
+        ))
+
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font, opacity: int = 255) -> None:
         """
         Render the entire glyphfall effect to screen.
 
+        Draws the glyphs gathered by the last update(); no array work
+        happens here.
+
         Args:
             surface: Surface to render to
             font: Font used for glyphs
+            opacity: Overall opacity of the effect (0-255), used for dimming
+        """
+        # Atlases built for another font are dropped by build_glyph_atlas
+        atlas = self._glyph_atlases.get(opacity) if font is self._glyph_atlas_font else None
+        if atlas is None:
+            atlas = self.build_glyph_atlas(font, opacity)
+
+        # Pair every glyph with its position and hand them to SDL in a single call
+        blit_sequence = list(zip(
+            map(atlas.__getitem__, self._visible_atlas_index),
+            self._visible_positions
+        ))
+
+        blit_batch(surface, blit_sequence)
+
+    def build_glyph_atlas(
+        self,
+        font: pygame.font.Font,
+        opacity: int = 255
+    ) -> List[pygame.Surface]:
         """
-        for stream in self.streams:
-            stream.draw(surface, font)
+        Pre-render every glyph at every visible trail slot.
+
+        Each glyph is rasterized once per color and copied for each slot's
+        alpha, so drawing never calls font.render. Dimmed variants fold the
+        opacity into the glyph alpha instead of needing an extra layer.
+
+        Args:
+            font: Font used for glyphs
+            opacity: Overall opacity of the effect (0-255)
+        Returns:
+            The atlas, indexed as slot * len(CHARACTER_SET) + glyph index
+        """
+        if font is not self._glyph_atlas_font:
+            self._glyph_atlases.clear()
+            self._glyph_atlas_font = font
+
+        rendered: Dict[Tuple[int, int, int], List[pygame.Surface]] = {}
+        atlas = []
+
+        for color, alpha in _APPEARANCE_TABLE[:_DRAWABLE_SLOTS]:
+            if color not in rendered:
+                rendered[color] = [
+                    font.render(char, True, color).convert_alpha()
+                    for char in MatrixConfig.CHARACTER_SET
+                ]
+
+            for glyph in rendered[color]:
+                glyph = glyph.copy()
+                glyph.set_alpha(alpha * opacity // 255)
+                atlas.append(glyph)
+
+        self._glyph_atlases[opacity] = atlas
+        return atlas
 
     def clear_all_streams(self) -> None:
         """Clear all glyphs from every stream."""
-        for stream in self.streams:
-            stream.clear()
+        self.counts[:] = 0
+        self._visible_atlas_index = []
+        self._visible_positions = []
 
     def set_intensity(self, intensity: float) -> None:
         """
@@ -180,11 +282,11 @@ class DataRainEffect:
         """
         intensity = max(0.0, min(1.0, intensity))
 
-        for stream in self.streams:
-            base_chance = random.uniform(
-                MatrixConfig.MIN_SPAWN_CHANCE,
-                MatrixConfig.MAX_SPAWN_CHANCE
-            )
-            stream.spawn_chance = base_chance * intensity
+        base_chances = self.rng.uniform(
+            MatrixConfig.MIN_SPAWN_CHANCE,
+            MatrixConfig.MAX_SPAWN_CHANCE,
+            len(self.spawn_chances)
+        )
+        self.spawn_chances = base_chances * intensity
 
 # SPYHVER-13: TRANSMIT
@@ -7,8 +7,8 @@ and game mode transitions.
 
 import pygame
 import os
+from collections import OrderedDict
 from typing import List, Optional, Tuple
-from dataclasses import dataclass, field
 
 from utils.game_config import (
     TerminalConfig, 
@@ -18,25 +18,45 @@ from utils.game_config import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT
 )
+from utils.render_utils import blit_batch
 from utils.text_utils import wrap_text
 from utils.theme import Theme, ThemeColors
 
-@dataclass
 class TerminalState:
     """Encapsulates the current state of the terminal."""
-    lines: List[str] = field(default_factory=lambda: DEFAULT_TERMINAL_LINES.copy())
-    current_input: str = ""
-    cursor_visible: bool = True
-    cursor_timer: int = 0
-    expanded: bool = False
+    __slots__ = (
+        "lines",
+        "current_input",
+        "cursor_visible",
+        "cursor_timer",
+        "expanded",
+        "revision"
+    )
+    
+    def __init__(self) -> None:
+        self.lines: List[str] = DEFAULT_TERMINAL_LINES.copy()
+        self.current_input = ""
+        self.cursor_visible = True
+        self.cursor_timer = 0
+        self.expanded = False
+        self.revision = 0  # bumped whenever lines are added
     
     def add_line(self, line: str) -> None:
         """Add a single line to the terminal output."""
         self.lines.append(line)
+        self._trim_history()
     
     def add_lines(self, lines: List[str]) -> None:
         """Add multiple lines to the terminal output."""
         self.lines.extend(lines)
+        self._trim_history()
+    
+    def _trim_history(self) -> None:
+        """Drop the oldest lines beyond the history limit."""
+        overflow = len(self.lines) - TerminalConfig.MAX_HISTORY_LINES
+        if overflow > 0:
+            del self.lines[:overflow]
+        self.revision += 1
     
     def clear(self) -> None:
         """Clear the terminal output."""
@@ -60,6 +80,20 @@ class Terminal:
         # 📐 Calculate dimensions
         self._update_dimensions()
 
+        # 🖋️ Pre-rendered text surfaces, reused across frames
+        self._line_cache: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+        self._line_cache_font: Optional[pygame.font.Font] = None
+        self._title_key: Optional[Tuple[str, Tuple[int, ...]]] = None
+        self._title_surface: Optional[pygame.Surface] = None
+        self._input_key: Optional[Tuple[str, bool]] = None
+        self._input_surface: Optional[pygame.Surface] = None
+
+        # 🗔 Composed terminal surface, rebuilt only when what it shows changes
+        self._terminal_surface: Optional[pygame.Surface] = None
+        self._content_key: Optional[tuple] = None
+        self._base_surface: Optional[pygame.Surface] = None
+        self._base_key: Optional[tuple] = None
+
         # 💬 Command registry
         self._command_handlers = {
             Commands.HELP: self._handle_help,
@@ -170,19 +204,15 @@ class Terminal:
         # Echo the command
         self.state.add_line(f"> {command}")
         
+        # Normalize command
+        cmd = command.lower().strip()
+        
         # Check for debug commands first (simple implementation)
-        if command.lower().startswith("boot.debug"):
+        if cmd.startswith("boot.debug"):
             self._handle_debug_command(command)
             self.debug_mode_active = False  # Reset flag after first use
             return
         
-        if command.lower().startswith("boot.debug"):
-            self._handle_debug_command(command)
-            return
-
-        # Normalize command
-        cmd = command.lower().strip()
-        
         # Route to appropriate handler
         if self.state.expanded and self.game_engine:
             self._handle_game_mode_command(cmd)
@@ -306,13 +336,7 @@ class Terminal:
     
     def _handle_normal_mode_command(self, cmd: str, original: str) -> None:
         """Handle commands when in normal mode."""
-        # Try to find a handler for the command
-        handler = self._command_handlers.get(cmd)
-        
-        if handler:
-            handler(original)
-        else:
-            self._handle_unknown(original)
+        self._command_handlers.get(cmd, self._handle_unknown)(original)
     
     # Command Handlers
     
@@ -326,6 +350,7 @@ class Terminal:
     def _handle_clear(self, command: str) -> None:
         """Clear the terminal screen."""
         self.state.clear()
+        self._line_cache.clear()
     
     def _handle_status(self, command: str) -> None:
         """Display system status."""
@@ -419,20 +444,41 @@ class Terminal:
             surface: The surface to draw on
             font: The font to use for text rendering
         """
-        # Create terminal surface
-        terminal_surface = self._create_terminal_surface()
+        # Lines are only ever added through the state or replaced outright, so
+        # the list object and its revision tell whether the content changed
+        content_key = (
+            self.state.lines,
+            self.state.revision,
+            self.state.expanded,
+            self.palette,
+            font
+        )
+        if content_key != self._content_key:
+            # Background, border and title bar only change with size or theme
+            base_key = (self.width, self.height, self.state.expanded, self.palette, font)
+            if base_key != self._base_key:
+                self._base_surface = self._create_terminal_surface()
+                self._draw_title_bar(self._base_surface, font)
+                self._base_key = base_key
+            
+            # Rebuild content on a fresh copy of the frame
+            self._terminal_surface = self._base_surface.copy()
+            self._draw_content(self._terminal_surface, font)
+            self._content_key = content_key
+            self._input_key = None
         
-        # Draw components
-        self._draw_title_bar(terminal_surface, font)
-        self._draw_content(terminal_surface, font)
-        self._draw_input_line(terminal_surface, font)
+        # Cursor blinks and keystrokes only repaint the input strip
+        self._draw_input_line(self._terminal_surface, font)
         
         # Blit to main surface
-        surface.blit(terminal_surface, (self.x, self.y))
+        surface.blit(self._terminal_surface, (self.x, self.y))
     
     def _create_terminal_surface(self) -> pygame.Surface:
         """Create the base terminal surface with background."""
-        terminal_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Match the display's alpha format so the per-frame blit needs no conversion
+        terminal_surface = pygame.Surface(
+            (self.width, self.height), pygame.SRCALPHA
+        ).convert_alpha()
         terminal_surface.fill(self.palette['terminal_bg'])
 
         pygame.draw.rect(
@@ -457,10 +503,13 @@ class Terminal:
         # ✅ Define the title BEFORE trying to render it
         title = "TERMINAL v2.1" + (" - GAME MODE" if self.state.expanded else "")
 
-        # Title text
-        title_surface = font.render(title, True, self.palette['text'])
+        # Title text (re-rendered only on expand/collapse or theme change)
+        title_key = (title, self.palette['text'])
+        if title_key != self._title_key:
+            self._title_surface = font.render(title, True, self.palette['text']).convert_alpha()
+            self._title_key = title_key
         surface.blit(
-            title_surface,
+            self._title_surface,
             (TerminalConfig.TITLE_MARGIN, TerminalConfig.TITLE_Y_OFFSET)
         )
 
@@ -475,40 +524,75 @@ class Terminal:
         max_content_lines = content_area_height // TerminalConfig.LINE_HEIGHT
         
         # Get lines to display (most recent)
-        display_lines = (
-            self.state.lines[-max_content_lines:] 
-            if len(self.state.lines) > max_content_lines 
-            else self.state.lines
-        )
+        display_lines = self.state.lines[-max_content_lines:]
         
-        # Draw each line
+        # Collect each line's cached surface and position, then blit them all at once
+        margin = TerminalConfig.TEXT_MARGIN
+        line_height = TerminalConfig.LINE_HEIGHT
+        blit_sequence = []
         for i, line in enumerate(display_lines):
-            y = TerminalConfig.CONTENT_Y_OFFSET + i * TerminalConfig.LINE_HEIGHT
+            y = TerminalConfig.CONTENT_Y_OFFSET + i * line_height
             
             # Handle long lines with word wrap if needed
             if len(line) > 80:  # Approximate character limit
                 wrapped_lines = wrap_text(line, 80)
                 for j, wrapped_line in enumerate(wrapped_lines):
                     if i + j < max_content_lines:
-                        text_surface = font.render(wrapped_line, True, Colors.TERMINAL_TEXT)
-                        surface.blit(
-                            text_surface, 
-                            (TerminalConfig.TEXT_MARGIN, y + j * TerminalConfig.LINE_HEIGHT)
-                        )
+                        blit_sequence.append((
+                            self._render_line(wrapped_line, font),
+                            (margin, y + j * line_height)
+                        ))
             else:
-                text_surface = font.render(line, True, Colors.TERMINAL_TEXT)
-                surface.blit(text_surface, (TerminalConfig.TEXT_MARGIN, y))
+                blit_sequence.append((self._render_line(line, font), (margin, y)))
+        
+        blit_batch(surface, blit_sequence)
+    
+    def _render_line(self, line: str, font: pygame.font.Font) -> pygame.Surface:
+        """
+        Get the rendered surface for a content line, rendering on cache miss.
+        
+        Args:
+            line: The text to render
+            font: The font to render with
+            
+        Returns:
+            The pre-rendered line surface
+        """
+        if font is not self._line_cache_font:
+            self._line_cache.clear()
+            self._line_cache_font = font
+        
+        cache = self._line_cache
+        text_surface = cache.get(line)
+        if text_surface is None:
+            text_surface = font.render(line, True, Colors.TERMINAL_TEXT).convert_alpha()
+            cache[line] = text_surface
+            if len(cache) > TerminalConfig.LINE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(line)
+        return text_surface
     
     def _draw_input_line(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw the input line at the bottom of the terminal."""
         input_area_y = self.height - TerminalConfig.LINE_HEIGHT - TerminalConfig.TEXT_MARGIN
         
-        # Build input line with cursor
-        cursor = "_" if self.state.cursor_visible else ""
-        input_line = f"> {self.state.current_input}{cursor}"
+        # Re-render only when the input text or cursor blink state changed
+        input_key = (self.state.current_input, self.state.cursor_visible)
+        if input_key == self._input_key:
+            return
+        
+        cursor = TerminalConfig.CURSOR if self.state.cursor_visible else ""
+        input_line = TerminalConfig.PROMPT + self.state.current_input + cursor
+        self._input_surface = font.render(input_line, True, Colors.TERMINAL_TEXT).convert_alpha()
+        self._input_key = input_key
         
-        # Render and draw
-        input_surface = font.render(input_line, True, Colors.TERMINAL_TEXT)
-        surface.blit(input_surface, (TerminalConfig.TEXT_MARGIN, input_area_y))
+        # Clear the previous input inside the border before drawing the new one
+        border = TerminalConfig.BORDER_WIDTH
+        surface.fill(
+            self.palette['terminal_bg'],
+            (border, input_area_y, self.width - 2 * border, TerminalConfig.LINE_HEIGHT)
+        )
+        surface.blit(self._input_surface, (TerminalConfig.TEXT_MARGIN, input_area_y))
 
 # SPYHVER-14: ACROSS
\ No newline at end of file
@@ -8,8 +8,7 @@ and transition to the main game.
 import pygame
 import random
 import math
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
 
 from utils.game_config import (
     TitleScreenConfig,
@@ -21,28 +20,44 @@ from utils.game_config import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT
 )
+from utils.render_utils import blit_batch
 
-@dataclass
 class TitleScreenState:
     """Encapsulates the state of the title screen."""
-    # Fields without defaults would go here (but we don't have any)
+    __slots__ = (
+        "active",
+        "pulse_phase",
+        "current_message_index",
+        "message_timer",
+        "input_text",
+        "cursor_visible",
+        "cursor_timer",
+        "glitch_active",
+        "glitch_timer",
+        "boot_sequence_active",
+        "boot_sequence_index",
+        "boot_sequence_timer",
+        "debug_mode_requested",
+        "quick_boot_requested",
+        "boot_lines"
+    )
     
-    # Fields with defaults
-    active: bool = True
-    pulse_phase: float = 0.0
-    current_message_index: int = 0
-    message_timer: int = 0
-    input_text: str = ""
-    cursor_visible: bool = True
-    cursor_timer: int = 0
-    glitch_active: bool = False
-    glitch_timer: int = 0
-    boot_sequence_active: bool = False
-    boot_sequence_index: int = 0
-    boot_sequence_timer: int = 0
-    debug_mode_requested: bool = False
-    quick_boot_requested: bool = False  # NEW: Skip boot sequence
-    boot_lines: List[str] = field(default_factory=list)  # This must come last
+    def __init__(self) -> None:
+        self.active = True
+        self.pulse_phase = 0.0
+        self.current_message_index = 0
+        self.message_timer = 0
+        self.input_text = ""
+        self.cursor_visible = True
+        self.cursor_timer = 0
+        self.glitch_active = False
+        self.glitch_timer = 0
+        self.boot_sequence_active = False
+        self.boot_sequence_index = 0
+        self.boot_sequence_timer = 0
+        self.debug_mode_requested = False
+        self.quick_boot_requested = False  # Skip boot sequence
+        self.boot_lines: List[str] = []
 
 class TitleScreen:
     """
@@ -69,6 +84,13 @@ class TitleScreen:
         self.screen_center_y = SCREEN_HEIGHT // 2
         self.title_y = SCREEN_HEIGHT // 3
         self.mini_terminal_y = SCREEN_HEIGHT * 2 // 3
+        
+        # Rendered title and scaled glow layers for the unglitched text
+        self._title_surfaces: Optional[Tuple[pygame.Surface, List[pygame.Surface]]] = None
+        
+        # Boot sequence lines and cursor, rendered on first use
+        self._boot_surfaces: List[pygame.Surface] = []
+        self._boot_cursor: Optional[pygame.Surface] = None
     
     def update(self) -> bool:
         """
@@ -211,29 +233,60 @@ class TitleScreen:
         pulse_intensity = (math.sin(self.state.pulse_phase) + 1) / 2
         glow_alpha = int(100 + 155 * pulse_intensity)
         
-        # Get title text (with optional glitch)
-        title_text = self._get_title_text()
+        # Glitched text changes every frame; the clean title is rendered once
+        if self.state.glitch_active:
+            title_surface, glow_surfaces = self._render_title(self._get_title_text())
+        else:
+            if self._title_surfaces is None:
+                self._title_surfaces = self._render_title(self._get_title_text())
+            title_surface, glow_surfaces = self._title_surfaces
         
-        # Render title
-        title_font = self.fonts['title']
-        title_surface = title_font.render(title_text, True, Colors.TITLE_CORE)
         title_rect = title_surface.get_rect(center=(self.screen_center_x, self.title_y))
         
         # Draw glow layers
-        self._draw_glow_layers(surface, title_text, title_rect, glow_alpha)
+        self._draw_glow_layers(surface, glow_surfaces, title_rect, glow_alpha)
         
         # Draw main title
         surface.blit(title_surface, title_rect)
     
+    def _render_title(self, text: str) -> Tuple[pygame.Surface, List[pygame.Surface]]:
+        """
+        Render the title text and its scaled glow layers.
+        
+        Args:
+            text: The title text to render
+            
+        Returns:
+            Tuple of (title surface, glow layers from widest to narrowest)
+        """
+        title_font = self.fonts['title']
+        # Match the display format once so repeated blits skip the conversion
+        title_surface = title_font.render(text, True, Colors.TITLE_CORE).convert_alpha()
+        glow_base = title_font.render(text, True, Colors.TITLE_GLOW).convert_alpha()
+        width, height = glow_base.get_size()
+        
+        glow_surfaces = []
+        for i in range(3, 0, -1):
+            # Scale up for glow effect
+            scale_factor = 1 + i * 0.05
+            glow_surfaces.append(pygame.transform.scale(
+                glow_base,
+                (int(width * scale_factor), int(height * scale_factor))
+            ))
+        
+        return title_surface, glow_surfaces
+    
     def _get_title_text(self) -> str:
         """Get the title text, applying glitch effect if active."""
         title_text = "BASILISK_PROTOCOL"
         
         if self.state.glitch_active:
-            # Apply glitch effect
+            # Apply glitch effect, drawing all replacement glyphs in one call
+            replacements = random.choices(MatrixConfig.CHARACTER_SET, k=len(title_text))
+            roll = random.random
             title_text = ''.join(
-                random.choice(MatrixConfig.CHARACTER_SET) if random.random() < 0.3 else c 
-                for c in title_text
+                r if roll() < 0.3 else c 
+                for c, r in zip(title_text, replacements)
             )
         
         return title_text
@@ -241,15 +294,12 @@ class TitleScreen:
     def _draw_glow_layers(
         self, 
         surface: pygame.Surface, 
-        text: str, 
+        glow_surfaces: List[pygame.Surface], 
         base_rect: pygame.Rect, 
         alpha: int
     ) -> None:
         """Draw multiple glow layers for text effect."""
-        title_font = self.fonts['title']
-        
-        for i in range(3, 0, -1):
-            glow_surface = title_font.render(text, True, Colors.TITLE_GLOW)
+        for i, glow_surface in zip(range(3, 0, -1), glow_surfaces):
             glow_surface.set_alpha(alpha // i)
             
             # Add glitch offset if active
@@ -260,15 +310,6 @@ class TitleScreen:
                 center=(base_rect.centerx + offset_x, base_rect.centery + offset_y)
             )
             
-            # Scale up for glow effect
-            scale_factor = 1 + i * 0.05
-            glow_surface = pygame.transform.scale(
-                glow_surface,
-                (int(glow_rect.width * scale_factor), 
-                 int(glow_rect.height * scale_factor))
-            )
-            glow_rect = glow_surface.get_rect(center=glow_rect.center)
-            
             surface.blit(glow_surface, glow_rect)
     
     def _draw_cycling_message(self, surface: pygame.Surface) -> None:
@@ -303,8 +344,8 @@ class TitleScreen:
         
         # Draw input text
         font = self.fonts['mini_terminal']
-        cursor = "_" if self.state.cursor_visible else ""
-        input_line = f"> {self.state.input_text}{cursor}"
+        cursor = TerminalConfig.CURSOR if self.state.cursor_visible else ""
+        input_line = TerminalConfig.PROMPT + self.state.input_text + cursor
         text_surface = font.render(input_line, True, Colors.TERMINAL_TEXT)
         text_y = (height - text_surface.get_height()) // 2
         terminal_surface.blit(text_surface, (10, text_y))
@@ -324,24 +365,36 @@ class TitleScreen:
         # Dark background
         surface.fill(Colors.BLACK)
         
-        # Draw boot lines
-        font = self.fonts['terminal']
+        # BOOT_SEQUENCE never changes, so each line is rendered only once
+        if not self._boot_surfaces:
+            self._render_boot_sequence()
+        
+        # Draw boot lines (always a prefix of BOOT_SEQUENCE)
         y_offset = 50
         line_height = 25
-        
-        for i, line in enumerate(self.state.boot_lines):
-            # Determine line color
-            color = self._get_boot_line_color(line)
-            
-            # Render line
-            text_surface = font.render(line, True, color)
-            surface.blit(text_surface, (50, y_offset + i * line_height))
+        shown = len(self.state.boot_lines)
+        
+        blit_batch(
+            surface,
+            [
+                (text_surface, (50, y_offset + i * line_height))
+                for i, text_surface in enumerate(self._boot_surfaces[:shown])
+            ]
+        )
         
         # Add blinking cursor at the end
-        if self.state.cursor_visible and len(self.state.boot_lines) < len(BOOT_SEQUENCE):
-            cursor_y = y_offset + len(self.state.boot_lines) * line_height
-            cursor_surface = font.render("_", True, Colors.TERMINAL_TEXT)
-            surface.blit(cursor_surface, (50, cursor_y))
+        if self.state.cursor_visible and shown < len(BOOT_SEQUENCE):
+            cursor_y = y_offset + shown * line_height
+            surface.blit(self._boot_cursor, (50, cursor_y))
+    
+    def _render_boot_sequence(self) -> None:
+        """Pre-render every boot sequence line and the boot cursor."""
+        font = self.fonts['terminal']
+        self._boot_surfaces = [
+            font.render(line, True, self._get_boot_line_color(line)).convert_alpha()
+            for line in BOOT_SEQUENCE
+        ]
+        self._boot_cursor = font.render(TerminalConfig.CURSOR, True, Colors.TERMINAL_TEXT).convert_alpha()
     
     def _get_boot_line_color(self, line: str) -> tuple:
         """Get the appropriate color for a boot sequence line."""
@@ -1,6 +1,8 @@
 import pygame
 import asyncio
+import os
 import platform
+import time
 from typing import Optional
 
 from utils.game_config import (
@@ -9,13 +11,17 @@ from utils.game_config import (
     WINDOW_TITLE, 
     TARGET_FPS,
     Colors,
-    FontConfig
+    FontConfig,
+    MatrixConfig
 )
 from components.data_rain_effect import DataRainEffect
 from components.terminal import Terminal
 from components.title_screen import TitleScreen
 from utils.file_cleanup import clean_pycache
 
+# The platform never changes while running, so resolve it once at import
+IS_WEB = platform.system() == "Emscripten"
+
 class BasiliskProtocol:
     """
     Main application class for The Basilisk Protocol game.
@@ -27,6 +33,8 @@ class BasiliskProtocol:
     def __init__(self) -> None:
         """Initialize the game application."""
         pygame.init()
+        # Order matters: cached text and glyph surfaces are converted to the
+        # display format, which needs the display mode set first
         self._setup_display()
         self._setup_fonts()
         self._setup_components()
@@ -40,35 +48,63 @@ class BasiliskProtocol:
         """Configure the game display."""
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(WINDOW_TITLE)
+        
+        # Only quit and key presses are handled; let SDL drop everything
+        # else (mouse motion, window events) before it reaches Python.
+        # TEXTINPUT must stay allowed: pygame fills KEYDOWN.unicode from it,
+        # and without it shifted keys and non-US layouts type the bare key
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT])
     
     def _setup_fonts(self) -> None:
         """Initialize all game fonts."""
         self.fonts = {
-            'stream': pygame.font.SysFont(
+            'stream': self._load_font(
                 FontConfig.STREAM_FONT_NAME, 
                 FontConfig.STREAM_FONT_SIZE
             ),
-            'terminal': pygame.font.SysFont(
+            'terminal': self._load_font(
                 FontConfig.TERMINAL_FONT_NAME, 
                 FontConfig.TERMINAL_FONT_SIZE
             ),
-            'title': pygame.font.SysFont(
+            'title': self._load_font(
                 FontConfig.TITLE_FONT_NAME,
                 FontConfig.TITLE_FONT_SIZE
             ),
-            'subtitle': pygame.font.SysFont(
+            'subtitle': self._load_font(
                 FontConfig.TERMINAL_FONT_NAME,
                 FontConfig.SUBTITLE_FONT_SIZE
             ),
-            'mini_terminal': pygame.font.SysFont(
+            'mini_terminal': self._load_font(
                 FontConfig.TERMINAL_FONT_NAME,
                 FontConfig.MINI_TERMINAL_FONT_SIZE
             )
         }
     
+    @staticmethod
+    def _load_font(name: str, size: int) -> pygame.font.Font:
+        """
+        Load a font, preferring a bundled TTF over a system font lookup.
+        
+        Args:
+            name: Font name, mapped to a file by FontConfig.BUNDLED_FONTS
+            size: Point size
+            
+        Returns:
+            The loaded font
+        """
+        bundled = FontConfig.BUNDLED_FONTS.get(name)
+        if bundled:
+            font_path = os.path.join(FontConfig.FONT_DIR, bundled)
+            if os.path.isfile(font_path):
+                return pygame.font.Font(font_path, size)
+        return pygame.font.SysFont(name, size)
+    
     def _setup_components(self) -> None:
         """Initialize game components."""
         self.matrix_effect = DataRainEffect(SCREEN_WIDTH, SCREEN_HEIGHT)
+        for opacity in (255, MatrixConfig.TITLE_SCREEN_OPACITY, MatrixConfig.DIMMED_OPACITY):
+            self.matrix_effect.build_glyph_atlas(self.fonts['stream'], opacity)
         self.terminal = Terminal()
         self.title_screen = TitleScreen(self.screen, self.fonts)
     
@@ -109,7 +145,7 @@ class BasiliskProtocol:
     def _handle_game_input(self, event: pygame.event.Event) -> None:
         """Handle input during main game."""
         # Special key combinations
-        if event.key == pygame.K_SPACE and pygame.key.get_mods() & pygame.KMOD_CTRL:
+        if event.key == pygame.K_SPACE and event.mod & pygame.KMOD_CTRL:
             self.matrix_effect.clear_all_streams()
             return
         
@@ -171,11 +207,7 @@ class BasiliskProtocol:
     def _draw_title_screen(self) -> None:
         """Draw the title screen with dimmed matrix effect."""
         # Draw dimmed matrix background
-        dim_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        dim_surface.fill(Colors.BLACK)
-        self.matrix_effect.draw(dim_surface, self.fonts['stream'])
-        dim_surface.set_alpha(30)
-        self.screen.blit(dim_surface, (0, 0))
+        self._draw_dimmed_matrix(MatrixConfig.TITLE_SCREEN_OPACITY)
         
         # Draw title screen on top
         self.title_screen.draw(self.screen)
@@ -191,30 +223,67 @@ class BasiliskProtocol:
         # Draw terminal
         self.terminal.draw(self.screen, self.fonts['terminal'])
     
-    def _draw_dimmed_matrix(self) -> None:
-        """Draw matrix effect with reduced opacity."""
-        dim_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        dim_surface.fill(Colors.BLACK)
-        self.matrix_effect.draw(dim_surface, self.fonts['stream'])
-        dim_surface.set_alpha(50)
-        self.screen.blit(dim_surface, (0, 0))
+    def _draw_dimmed_matrix(self, opacity: int = MatrixConfig.DIMMED_OPACITY) -> None:
+        """
+        Draw matrix effect with reduced opacity.
+        
+        Args:
+            opacity: Opacity of the matrix effect (0-255)
+        """
+        self.matrix_effect.draw(self.screen, self.fonts['stream'], opacity)
+    
+    def run_native(self) -> None:
+        """
+        Main game loop for desktop platforms.
+        
+        Runs as a plain loop; nothing else needs an asyncio event loop, so
+        no coroutine is suspended and resumed every frame.
+        """
+        # Resolve per-frame lookups once, outside the loop
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        tick = self.clock.tick
+        
+        while self.running:
+            handle_events()
+            update()
+            draw()
+            
+            # Clock.tick sleeps through SDL_Delay for the rest of the
+            # frame; tick_busy_loop would spin the CPU instead
+            tick(TARGET_FPS)
     
     async def run(self) -> None:
         """
-        Main game loop with platform-specific timing.
+        Main game loop for the Emscripten (web) platform.
         
-        Supports both native and Emscripten (web) platforms.
+        The browser drives the asyncio loop, so every frame must yield
+        back to it.
         """
+        # Resolve per-frame lookups once, outside the loop
+        handle_events = self.handle_events
+        update = self.update
+        draw = self.draw
+        frame_time = 1.0 / TARGET_FPS
+        monotonic = time.monotonic
+        next_frame = monotonic()
+        
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
+            handle_events()
+            update()
+            draw()
             
-            # Platform-specific frame timing
-            if platform.system() == "Emscripten":
-                await asyncio.sleep(1.0 / TARGET_FPS)
-            else:
-                self.clock.tick(TARGET_FPS)
+            # Sleep until the next frame deadline rather than a fixed
+            # frame_time, so time spent updating and drawing is not
+            # added on top of the sleep
+            next_frame += frame_time
+            delay = next_frame - monotonic()
+            if delay < 0:
+                # Running behind; resync instead of rushing to catch up
+                next_frame -= delay
+                delay = 0
+            await asyncio.sleep(delay)
     
     def cleanup(self) -> None:
         """Clean up pygame resources."""
@@ -227,13 +296,16 @@ def main() -> None:
     
     try:
         # Run with appropriate event loop for platform
-        if platform.system() == "Emscripten":
+        if IS_WEB:
             asyncio.ensure_future(app.run())
         else:
-            asyncio.run(app.run())
+            app.run_native()
     finally:
         app.cleanup()
-        clean_pycache()
+        
+        # Keeping __pycache__ makes the next launch faster; opt in to wiping it
+        if os.environ.get("BASILISK_CLEAN_PYC"):
+            clean_pycache(os.path.dirname(os.path.abspath(__file__)))
 
 
 if __name__ == "__main__":
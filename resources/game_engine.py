@@ -5,7 +5,9 @@ Handles room-based adventure game logic with dynamic room loading.
 
 import os
 import importlib
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from utils.room_utils import GAME_RESET_TEXT, RESTART_OPTIONS_TEXT, RESTART_WARNING_TEXT
 
 # =============================================================================
 # CONSTANTS
@@ -28,6 +30,31 @@ GLOBAL_COMMANDS = {
     'reset': ['reset'],
 }
 
+# Alias -> command name, so dispatch is a single lookup
+GLOBAL_COMMAND_ALIASES = {
+    alias: name
+    for name, aliases in GLOBAL_COMMANDS.items()
+    for alias in aliases
+}
+
+# Static help text, built once rather than on every help request
+GLOBAL_HELP_TEXT = (
+    "=== GLOBAL COMMANDS ===",
+    "help/h       - Show this help",
+    "inventory/i  - Show inventory",
+    "score        - Show current score",
+    "health       - Show current health",
+    "status       - Show all status info",
+    "restart      - Restart options (room/game)",
+    "stop         - Exit game mode"
+)
+
+DEBUG_HELP_TEXT = (
+    "",
+    "=== DEBUG MODE ACTIVE ===",
+    "You are in DEBUG mode with unrestricted room access."
+)
+
 # =============================================================================
 # GAME STATE CLASS
 # =============================================================================
@@ -35,6 +62,9 @@ GLOBAL_COMMANDS = {
 class GameState:
     """Manages core game data including inventory, score, health, and room state."""
 
+    # Room modules shared by every GameState; discovered on first use
+    _room_cache: Optional[Dict[str, Any]] = None
+
     def __init__(self) -> None:
         self.score: int = DEFAULT_SCORE
         self.health: int = DEFAULT_HEALTH
@@ -61,16 +91,26 @@ class GameState:
         """Reset the game state to initial values."""
         self.score = self._initial_state['score']
         self.health = self._initial_state['health']
-        self.inventory = self._initial_state['inventory'].copy()
+        # Clear in place so anything holding these containers sees the reset
+        self.inventory.clear()
+        self.inventory.extend(self._initial_state['inventory'])
         self.current_room = self._initial_state['current_room']
-        self.game_flags = self._initial_state['game_flags'].copy()
+        self.game_flags.clear()
+        self.game_flags.update(self._initial_state['game_flags'])
         self.player_name = self._initial_state['player_name']
         self.debug_mode = False
 
     def _load_rooms(self) -> None:
         """Load all room modules from the rooms directory and subdirectories."""
+        # Imported modules never change, so a reset reuses the first scan
+        # instead of walking the directory tree again
+        if GameState._room_cache is not None:
+            self.rooms = GameState._room_cache
+            return
+        
         self._ensure_rooms_directory_exists()
         self._import_room_modules()
+        GameState._room_cache = self.rooms
 
     def _ensure_rooms_directory_exists(self) -> None:
         """Create rooms directory if it doesn't exist."""
@@ -176,20 +216,15 @@ class GameState:
     
     def clear_room_flags(self, room_prefix: str) -> int:
         """Clear all flags associated with a specific room. Returns count of cleared flags."""
-        cleared_count = 0
-        flags_to_clear = []
-        
-        # Find all flags that might be associated with this room
-        for flag in self.game_flags.keys():
-            if room_prefix in flag or flag.startswith(room_prefix):
-                flags_to_clear.append(flag)
+        # Find all flags that might be associated with this room; a
+        # substring match already covers flags that start with the prefix
+        flags_to_clear = [flag for flag in self.game_flags if room_prefix in flag]
         
         # Clear the flags
         for flag in flags_to_clear:
-            self.clear_flag(flag)
-            cleared_count += 1
+            del self.game_flags[flag]
         
-        return cleared_count
+        return len(flags_to_clear)
 
     # Health and score management
     def modify_health(self, amount: int) -> None:
@@ -252,42 +287,33 @@ class GameEngine:
         self.game_state = GameState()
         self.in_game_mode = False
         self.loaded_rooms = {}
+        
+        # Global command name -> handler taking the full command
+        self._global_handlers = {
+            'inventory': lambda command: self._handle_inventory_command(),
+            'score': lambda command: [f"Score: {self.game_state.score}"],
+            'health': lambda command: [f"Health: {self.game_state.health}"],
+            'status': lambda command: self._handle_status_command(),
+            'help': lambda command: self.get_help_text(),
+            'restart': self._handle_restart_command,
+            'reset': self._handle_restart_command,
+        }
 
     def process_game_command(self, command: str) -> List[str]:
         """Process a game command and return output lines."""
-        command = command.lower().strip()
+        command = command.strip()
+        # Typed commands are nearly always lowercase already; skip the copy
+        if not command.islower():
+            command = command.lower()
         
-        # Handle global commands first
-        if self._is_global_command(command):
-            return self._process_global_command(command)
+        # Handle global commands first; one lookup both detects and dispatches
+        global_command = GLOBAL_COMMAND_ALIASES.get(command)
+        if global_command is not None:
+            return self._global_handlers[global_command](command)
         
         # Handle room-specific commands
         return self._process_room_command(command)
 
-    def _is_global_command(self, command: str) -> bool:
-        """Check if command is a global command."""
-        for cmd_aliases in GLOBAL_COMMANDS.values():
-            if command in cmd_aliases:
-                return True
-        return False
-
-    def _process_global_command(self, command: str) -> List[str]:
-        """Process global commands that work in any room."""
-        if command in GLOBAL_COMMANDS['inventory']:
-            return self._handle_inventory_command()
-        elif command in GLOBAL_COMMANDS['score']:
-            return [f"Score: {self.game_state.score}"]
-        elif command in GLOBAL_COMMANDS['health']:
-            return [f"Health: {self.game_state.health}"]
-        elif command in GLOBAL_COMMANDS['status']:
-            return self._handle_status_command()
-        elif command in GLOBAL_COMMANDS['help']:
-            return self.get_help_text()
-        elif command in GLOBAL_COMMANDS['restart'] or command in GLOBAL_COMMANDS['reset']:
-            return self._handle_restart_command(command)
-        
-        return ["Unknown global command."]
-
     def _handle_restart_command(self, command: str) -> List[str]:
         """Handle restart/reset commands with options."""
         # Check for specific restart commands
@@ -295,14 +321,7 @@ class GameEngine:
         
         if len(parts) == 1:
             # Just "restart" or "reset" - show options
-            return [
-                "=== RESTART OPTIONS ===",
-                "restart room     - Reset current room puzzles",
-                "restart game     - Reset entire game to beginning",
-                "restart confirm  - Confirm full game reset",
-                "",
-                "Note: 'restart room' keeps your inventory and progress in other rooms"
-            ]
+            return list(RESTART_OPTIONS_TEXT)
         
         if len(parts) >= 2:
             option = parts[1]
@@ -310,11 +329,7 @@ class GameEngine:
             if option == "room":
                 return self._restart_current_room()
             elif option == "game":
-                return [
-                    "=== WARNING ===",
-                    "This will reset ALL progress, inventory, and flags!",
-                    "Type 'restart confirm' to proceed, or any other command to cancel."
-                ]
+                return list(RESTART_WARNING_TEXT)
             elif option == "confirm":
                 return self._restart_entire_game()
         
@@ -346,12 +361,7 @@ class GameEngine:
         # Reset game state
         self.game_state.reset_to_initial_state()
         
-        lines = [
-            "=== GAME RESET COMPLETE ===",
-            "All progress has been erased.",
-            "Starting from the beginning...",
-            ""
-        ]
+        lines = list(GAME_RESET_TEXT)
         
         # Execute entry logic for starting room
         room_entry_output = self._execute_room_entry()
@@ -390,15 +400,21 @@ class GameEngine:
         if not current_room_module:
             return [f"Error: Room '{self.game_state.current_room}' not loaded."]
         
-        if not hasattr(current_room_module, 'handle_input'):
+        handle_input = getattr(current_room_module, 'handle_input', None)
+        if handle_input is None:
             return [f"Room '{self.game_state.current_room}' doesn't handle input."]
         
-        return self._execute_room_command(current_room_module, command)
+        return self._execute_room_command(current_room_module, handle_input, command)
 
-    def _execute_room_command(self, room_module: Any, command: str) -> List[str]:
-        """Execute a command in the given room module."""
+    def _execute_room_command(
+        self,
+        room_module: Any,
+        handle_input: Callable[..., Any],
+        command: str
+    ) -> List[str]:
+        """Execute a command through the given room module's input handler."""
         try:
-            result = room_module.handle_input(
+            result = handle_input(
                 command, 
                 self.game_state, 
                 room_module=room_module
@@ -417,19 +433,22 @@ class GameEngine:
         
         if next_room and next_room != self.game_state.current_room:
             room_change_output = self._handle_room_change(next_room)
-            output_lines.extend(room_change_output)
+            # Build a new list; output may be a room's shared message list
+            output_lines = [*output_lines, *room_change_output]
         
         return output_lines
 
-    def _format_command_output(self, output: Union[str, List[str]]) -> List[str]:
+    def _format_command_output(self, output: Union[str, List[str], Tuple[str, ...]]) -> List[str]:
         """Format command output into a list of strings."""
         if isinstance(output, list):
             return output
+        elif isinstance(output, tuple):
+            return list(output)
         elif isinstance(output, str):
             return [output]
         return []
 
-    def _handle_room_change(self, next_room: str) -> List[str]:
+    def _handle_room_change(self, next_room: str) -> Sequence[str]:
         """Handle changing to a new room."""
         if not self.game_state.room_exists(next_room):
             return [f"Error: Room '{next_room}' not found!"]
@@ -437,15 +456,22 @@ class GameEngine:
         self.game_state.change_room(next_room)
         return self._execute_room_entry()
 
-    def _execute_room_entry(self) -> List[str]:
-        """Execute room entry logic for the current room."""
+    def _execute_room_entry(self) -> Sequence[str]:
+        """
+        Execute room entry logic for the current room.
+        
+        Rooms may return a shared tuple, so callers copy the lines rather
+        than mutating the result.
+        """
         current_room_module = self.game_state.get_current_room_module()
         
-        if not current_room_module or not hasattr(current_room_module, 'enter_room'):
+        # One getattr both checks for the hook and fetches it
+        enter_room = getattr(current_room_module, 'enter_room', None)
+        if enter_room is None:
             return []
         
         try:
-            enter_output = current_room_module.enter_room(self.game_state)
+            enter_output = enter_room(self.game_state)
             return enter_output if enter_output else []
         except Exception as e:
             return [f"Error entering room: {str(e)}"]
@@ -460,34 +486,22 @@ class GameEngine:
             lines.extend(room_help)
         
         if self.game_state.debug_mode:
-            lines.extend([
-                "",
-                "=== DEBUG MODE ACTIVE ===",
-                "You are in DEBUG mode with unrestricted room access."
-            ])
+            lines.extend(DEBUG_HELP_TEXT)
         
         return lines
 
     def _get_global_help_text(self) -> List[str]:
         """Get help text for global commands."""
-        return [
-            "=== GLOBAL COMMANDS ===",
-            "help/h       - Show this help",
-            "inventory/i  - Show inventory",
-            "score        - Show current score",
-            "health       - Show current health",
-            "status       - Show all status info",
-            "restart      - Restart options (room/game)",
-            "stop         - Exit game mode"
-        ]
+        return list(GLOBAL_HELP_TEXT)
 
     def _get_room_help_text(self, room_module: Any) -> List[str]:
         """Get help text for room-specific commands."""
-        if not hasattr(room_module, 'get_available_commands'):
+        get_available_commands = getattr(room_module, 'get_available_commands', None)
+        if get_available_commands is None:
             return []
         
         try:
-            room_commands = room_module.get_available_commands()
+            room_commands = get_available_commands()
             if not room_commands:
                 return []
             
@@ -533,7 +547,7 @@ class GameEngine:
 
     def reset_game(self) -> List[str]:
         """Reset the game state to initial values."""
-        self.game_state = GameState()
+        self.game_state.reset_to_initial_state()
         return [
             "Game reset to initial state.",
             f"Current room: {self.game_state.current_room}",
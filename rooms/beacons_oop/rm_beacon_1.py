@@ -1,9 +1,15 @@
+import re
+
 from utils.room_utils import (
     BaseRoom, RoomConfig, PuzzleCommand
 )
 
+# "hack terminal <id>"; the id is checked against the room's terminals
+HACK_TERMINAL_RE = re.compile(r"hack terminal\s+(\S+)$")
+
 class BeaconRoom1(BaseRoom):
     """Beacon Node 1"""
+    __slots__ = ('terminals', 'terminal_flags', 'memory_fragment')
     
     def __init__(self):
         config = RoomConfig(
@@ -24,6 +30,8 @@ class BeaconRoom1(BaseRoom):
             "2": "Signal Encoder",
             "3": "Broadcast Amplifier"
         }
+        # Terminal id -> its "hacked" flag, formatted once instead of per check
+        self.terminal_flags = {tid: f"terminal_{tid}_hacked" for tid in self.terminals}
         
         self.memory_fragment = {
             "name": "Memory Fragment Alpha",
@@ -55,7 +63,7 @@ class BeaconRoom1(BaseRoom):
             
             "configure": PuzzleCommand(
                 command="configure beacon",
-                requires=["terminal_1_hacked", "terminal_2_hacked", "terminal_3_hacked"],
+                requires=list(self.terminal_flags.values()),
                 sets="beacon_configured",
                 missing_req=[">> All terminals must be hacked before configuration."],
                 already_done=[">> Beacon already configured."],
@@ -86,8 +94,10 @@ class BeaconRoom1(BaseRoom):
         """Get appropriate progression hint"""
         if not game_state.get_flag("beacon_terminals_scanned"):
             return ">> Terminals unlisted. Try 'scan terminals'."
-        elif not self._all_terminals_hacked(game_state):
-            hacked = self._get_hacked_terminals(game_state)
+        
+        # One pass over the terminal flags answers both "all hacked?" and "which?"
+        hacked = self._get_hacked_terminals(game_state)
+        if len(hacked) < len(self.terminals):
             hacked_str = ', '.join(hacked) if hacked else 'None'
             return f">> Terminals hacked: {hacked_str}\n>> Use 'hack terminal 1/2/3' to access remaining systems."
         elif not game_state.get_flag("beacon_configured"):
@@ -100,15 +110,15 @@ class BeaconRoom1(BaseRoom):
     def _handle_specific_input(self, cmd: str, game_state):
         """Handle room-specific commands"""
         # Handle hack terminal command
+        match = HACK_TERMINAL_RE.match(cmd)
+        if match and match.group(1) in self.terminal_flags:
+            terminal_id = match.group(1)
+            flag = self.terminal_flags[terminal_id]
+            if game_state.get_flag(flag):
+                return None, [f">> Terminal {terminal_id} already hacked."]
+            game_state.set_flag(flag, True)
+            return None, [f">> Terminal {terminal_id} hack successful."]
         if cmd.startswith("hack terminal"):
-            parts = cmd.split()
-            if len(parts) == 3 and parts[2] in self.terminals:
-                terminal_id = parts[2]
-                flag = f"terminal_{terminal_id}_hacked"
-                if game_state.get_flag(flag):
-                    return None, [f">> Terminal {terminal_id} already hacked."]
-                game_state.set_flag(flag, True)
-                return None, [f">> Terminal {terminal_id} hack successful."]
             return None, [">> Invalid syntax. Try 'hack terminal 1'."]
         
         return None, None
@@ -134,23 +144,23 @@ class BeaconRoom1(BaseRoom):
     # Helper methods
     def _all_terminals_hacked(self, game_state) -> bool:
         """Check if all terminals are hacked"""
-        return all(game_state.get_flag(f"terminal_{i}_hacked") for i in self.terminals)
+        return all(game_state.get_flag(flag) for flag in self.terminal_flags.values())
     
     def _get_hacked_terminals(self, game_state) -> list:
         """Get list of hacked terminals"""
-        return [f"T{i}" for i in self.terminals if game_state.get_flag(f"terminal_{i}_hacked")]
+        return [f"T{tid}" for tid, flag in self.terminal_flags.items() if game_state.get_flag(flag)]
+
+# Module-level functions for compatibility. Progress lives in game_state,
+# so one room instance serves every call instead of rebuilding its puzzles
+_room = BeaconRoom1()
 
-# Module-level functions for compatibility
 def enter_room(game_state):
-    room = BeaconRoom1()
-    return room.enter_room(game_state)
+    return _room.enter_room(game_state)
 
 def handle_input(cmd, game_state, room_module=None):
-    room = BeaconRoom1()
-    return room.handle_input(cmd, game_state, room_module)
+    return _room.handle_input(cmd, game_state, room_module)
 
 def get_available_commands():
-    room = BeaconRoom1()
-    return room.get_available_commands()
+    return _room.get_available_commands()
 
 # SPYHVER-30: EXECUTE
@@ -5,6 +5,7 @@ from utils.room_utils import (
 
 class BeaconRoom2(TimedPuzzleRoom):
     """Beacon Node 2: Pulse Synchronization"""
+    __slots__ = ()
     
     def __init__(self):
         # Room configuration
@@ -280,7 +281,8 @@ class BeaconRoom2(TimedPuzzleRoom):
     def _fire_pulse(self, pulse_id: int, game_state):
         """Handle firing a specific pulse"""
         seq_state = self.get_sequence_state(game_state)
-        current_time = time.time()
+        # Only intervals matter, so use a clock that never jumps with wall time
+        current_time = time.monotonic()
         expected_sequence = self.timing_config["sequence"]
         
         # Check if this is the correct pulse
@@ -4,6 +4,7 @@ from utils.room_utils import (
 
 class BeaconRoom3(BaseRoom):
     """Beacon Node 3: Neural Network"""
+    __slots__ = ('servers', 'channels', 'valid_links')
     
     def __init__(self):
         # Room configuration
@@ -5,6 +5,7 @@ from utils.room_utils import (
 
 class BeaconRoom4(BaseRoom):
     """Beacon Node 4: Identity Cipher"""
+    __slots__ = ('cipher_config',)
     
     def __init__(self):
         # Room configuration
@@ -5,6 +5,7 @@ import random
 
 class BeaconRoom5(BaseRoom):
     """Beacon Node 5: Echo Chamber"""
+    __slots__ = ('echo_config',)
     
     def __init__(self):
         # Room configuration
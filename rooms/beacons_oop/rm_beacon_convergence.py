@@ -5,6 +5,7 @@ from utils.room_utils import (
 
 class BeaconConvergenceRoom(BaseRoom):
     """Beacon Convergence: The Awakening"""
+    __slots__ = ('dialogue_config', 'state_descriptions')
     
     def __init__(self):
         # Room configuration
@@ -29,7 +29,7 @@ STRUCTURE OVERVIEW:
 5. Implement enter_room and handle_input
 """
 
-from utils.room_utils import format_enter_lines, standard_commands, transition_to_room
+from utils.room_utils import format_enter_lines, matches_command, standard_commands, transition_to_room
 import random  # If you need randomization
 import time    # If you need timing
 
@@ -463,9 +463,9 @@ def process_puzzle_command(cmd, game_state, puzzle_config):
     
     This is what makes the dictionary system work!
     """
-    for action_key, action in puzzle_config.items():
-        # Check if this is the right command
-        if cmd == action["command"] or cmd.startswith(action["command"] + " "):
+    for action in puzzle_config.values():
+        # Check if this is the right command (exact, or followed by arguments)
+        if matches_command(cmd, action["command"]):
             
             # Handle dynamic responses (custom logic)
             if action.get("dynamic_response"):
@@ -547,13 +547,13 @@ def handle_input(cmd, game_state, room_module=None):
     Main input handler - processes all player commands.
     This is called for every command the player types.
     """
+    cmd = cmd.lower().strip()
+    
     # First, check standard commands (help, inventory, etc.)
-    handled, response = standard_commands(cmd, game_state, room_module)
+    handled, response = standard_commands(cmd, game_state, room_module, normalized=True)
     if handled:
         return None, response
     
-    cmd = cmd.lower().strip()
-    
     # Special case: exit command
     if cmd == "exit":
         if game_state.get_flag("puzzle_solved"):
@@ -318,12 +318,12 @@ def process_puzzle_command(cmd, game_state, puzzle_config):
 
 
 def handle_input(cmd, game_state, room_module=None):
-    handled, response = standard_commands(cmd, game_state, room_module)
+    cmd = cmd.lower().strip()
+    
+    handled, response = standard_commands(cmd, game_state, room_module, normalized=True)
     if handled:
         return None, response
     
-    cmd = cmd.lower().strip()
-    
     # Check all puzzle paths
     all_paths = [
         DISCOVERY_PATH,
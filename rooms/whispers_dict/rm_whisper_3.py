@@ -456,12 +456,12 @@ def process_puzzle_command(cmd, game_state, puzzle_config):
 
 
 def handle_input(cmd, game_state, room_module=None):
-    handled, response = standard_commands(cmd, game_state, room_module)
+    cmd = cmd.lower().strip()
+    
+    handled, response = standard_commands(cmd, game_state, room_module, normalized=True)
     if handled:
         return None, response
     
-    cmd = cmd.lower().strip()
-    
     # Check reconstruction commands first (they have variable format)
     if cmd.startswith("reconstruct "):
         transition, response = handle_reconstruct_command(cmd, game_state)
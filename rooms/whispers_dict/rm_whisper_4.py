@@ -263,11 +263,11 @@ def enter_room(game_state):
 # ============================================================================
 
 def handle_input(cmd, game_state, room_module=None):
-    handled, response = standard_commands(cmd, game_state, room_module)
+    cmd = cmd.lower().strip()
+    handled, response = standard_commands(cmd, game_state, room_module, normalized=True)
     if handled:
         return None, response
 
-    cmd = cmd.lower().strip()
     current_ip = game_state.get("grid_position", "192.168.1.1")
     node = get_node(current_ip)
     detection = get_detection(game_state)
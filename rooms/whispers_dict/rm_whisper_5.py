@@ -371,11 +371,11 @@ def handle_escape_loop(game_state):
 # ==========================================
 
 def handle_input(cmd, game_state, room_module=None):
-    handled, response = standard_commands(cmd, game_state, room_module)
+    cmd = cmd.lower().strip()
+    
+    handled, response = standard_commands(cmd, game_state, room_module, normalized=True)
     if handled:
         return None, response
-    
-    cmd = cmd.lower().strip()
     state = initialize_loop_state(game_state)
     
     # Track all commands
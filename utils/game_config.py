@@ -5,6 +5,7 @@ This file contains all game constants, settings, and configuration values.
 Modify these values to customize the game's appearance and behavior.
 """
 
+import os
 import string
 from typing import Tuple, List
 
@@ -53,6 +54,20 @@ class Colors:
 class FontConfig:
     """Font configuration for different UI elements."""
     
+    # Bundled fonts live here; resolved from this file so it does not
+    # depend on the working directory
+    FONT_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "resources", "fonts"
+    )
+    
+    # Bundled TTF loaded in place of each font name below, so startup does
+    # not probe the system fonts. Names not listed fall back to SysFont
+    BUNDLED_FONTS = {
+        "courier": "DejaVuSansMono.ttf",
+        "consolas": "DejaVuSansMono.ttf",
+    }
+    
     # Matrix stream font
     STREAM_FONT_NAME = "courier"
     STREAM_FONT_SIZE = 20
@@ -85,6 +100,11 @@ class MatrixConfig:
     FLICKER_CHANCE = 0.03
     FADE_LENGTH = 15
     BRIGHT_HEAD_COUNT = 3
+    GLYPH_POOL_SIZE = 4096  # random glyph indices drawn per refill
+    
+    # Opacity of the effect behind other screens (0-255)
+    TITLE_SCREEN_OPACITY = 30
+    DIMMED_OPACITY = 50
     
     # Character set for matrix rain
     CHARACTER_SET = string.ascii_letters + string.digits + "!@#$%^&*()_+-=[]{}|;:,.<>?"
@@ -121,6 +141,12 @@ class TerminalConfig:
     # Input settings
     MAX_INPUT_LENGTH = 50
     CURSOR_BLINK_RATE = 30  # frames
+    PROMPT = "> "
+    CURSOR = "_"
+    
+    # Rendering
+    LINE_CACHE_SIZE = 256  # pre-rendered line surfaces kept between frames
+    MAX_HISTORY_LINES = 500  # older output lines are discarded
 
 # =============================================================================
 # TITLE SCREEN SETTINGS
@@ -0,0 +1,32 @@
+# utils/render_utils.py
+"""
+Rendering utilities for The Basilisk Protocol.
+
+Provides helpers shared by the components that draw to pygame surfaces.
+"""
+
+from typing import Sequence, Tuple
+
+import pygame
+
+
+# pygame-ce (used by the web build) offers fblits, which skips per-item
+# argument parsing; upstream pygame only has blits
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+def blit_batch(
+    surface: pygame.Surface,
+    blit_sequence: Sequence[Tuple[pygame.Surface, Tuple[int, int]]]
+) -> None:
+    """
+    Draw many surfaces onto one surface in a single call.
+
+    Args:
+        surface: Surface to draw onto
+        blit_sequence: (source surface, position) pairs
+    """
+    if HAS_FBLITS:
+        surface.fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
@@ -2,7 +2,11 @@
 Room Utility Functions - Reduces duplication across room modules
 """
 
-from typing import Dict, List, Tuple, Optional, Callable, Any
+import re
+import sys
+from functools import lru_cache
+from types import FunctionType
+from typing import Dict, List, Tuple, Optional, Callable, Any, Sequence
 
 # ==========================================
 # ROOM CONFIGURATION CLASSES
@@ -10,6 +14,12 @@ from typing import Dict, List, Tuple, Optional, Callable, Any
 
 class PuzzleCommand:
     """Represents a single puzzle command configuration"""
+    __slots__ = (
+        'command', 'requires', 'sets', 'success', 'already_done',
+        'missing_req', 'transition', 'transition_msg', 'dynamic_handler',
+        'transition_result'
+    )
+    
     def __init__(self, 
                  command: str,
                  requires: List[str] = None,
@@ -23,22 +33,28 @@ class PuzzleCommand:
         self.command = command
         self.requires = requires or []
         self.sets = sets
-        self.success = success or [">> Command completed."]
-        self.already_done = already_done or [">> Already completed."]
-        self.missing_req = missing_req or [">> Requirements not met."]
+        # Shared defaults are tuples so no caller can mutate them in place
+        self.success = success or (">> Command completed.",)
+        self.already_done = already_done or (">> Already completed.",)
+        self.missing_req = missing_req or (">> Requirements not met.",)
         self.transition = transition
         self.transition_msg = transition_msg
         self.dynamic_handler = dynamic_handler
+        # (destination, message) pair, resolved when added to a PuzzleProcessor
+        self.transition_result: Optional[Tuple[str, List[str]]] = None
 
 class RoomConfig:
     """Centralized room configuration"""
+    __slots__ = ('name', 'entry_text', 'progression_hints', 'destinations')
+    
     def __init__(self, 
                  name: str,
                  entry_text: List[str],
                  progression_hints: Dict[str, str] = None,
                  destinations: Dict[str, str] = None):
         self.name = name
-        self.entry_text = entry_text
+        # Entry text never changes, so it is kept as a tuple the rooms can share
+        self.entry_text = tuple(entry_text)
         self.progression_hints = progression_hints or {}
         self.destinations = destinations or {}
 
@@ -46,8 +62,8 @@ class RoomConfig:
 # GAME STATE COMPATIBILITY HELPERS
 # ==========================================
 
-def get_flag_compat(game_state, flag: str, default: Any = False) -> Any:
-    """Get flag value with compatibility for different GameState implementations"""
+def _get_flag_fallback(game_state, flag: str, default: Any) -> Any:
+    """Get a flag without a usable get_flag method on the class"""
     if hasattr(game_state, 'get_flag'):
         return game_state.get_flag(flag, default)
     elif hasattr(game_state, 'game_flags'):
@@ -56,8 +72,8 @@ def get_flag_compat(game_state, flag: str, default: Any = False) -> Any:
         return game_state.flags.get(flag, default)
     return default
 
-def set_flag_compat(game_state, flag: str, value: Any = True) -> None:
-    """Set flag value with compatibility for different GameState implementations"""
+def _set_flag_fallback(game_state, flag: str, value: Any) -> None:
+    """Set a flag without a usable set_flag method on the class"""
     if hasattr(game_state, 'set_flag'):
         game_state.set_flag(flag, value)
     elif hasattr(game_state, 'game_flags'):
@@ -65,8 +81,8 @@ def set_flag_compat(game_state, flag: str, value: Any = True) -> None:
     elif hasattr(game_state, 'flags'):
         game_state.flags[flag] = value
 
-def clear_flag_compat(game_state, flag: str) -> bool:
-    """Clear flag with compatibility for different GameState implementations"""
+def _clear_flag_fallback(game_state, flag: str) -> bool:
+    """Clear a flag without a usable clear_flag method on the class"""
     if hasattr(game_state, 'clear_flag'):
         return game_state.clear_flag(flag)
     elif hasattr(game_state, 'game_flags') and flag in game_state.game_flags:
@@ -77,6 +93,39 @@ def clear_flag_compat(game_state, flag: str) -> bool:
         return True
     return False
 
+# GameState type -> (get, set, clear), so the method lookups run once per type
+_FLAG_ACCESSORS: Dict[type, Tuple[Callable, Callable, Callable]] = {}
+
+def _resolve_flag_accessors(cls: type) -> Tuple[Callable, Callable, Callable]:
+    """Pick the (get, set, clear) flag accessors for a GameState type and cache them"""
+    accessors = []
+    for name, fallback in (('get_flag', _get_flag_fallback),
+                           ('set_flag', _set_flag_fallback),
+                           ('clear_flag', _clear_flag_fallback)):
+        # Each accessor is chosen on its own. A plain function on the class is
+        # called directly, skipping the bound-method hop; anything else goes
+        # through the per-instance checks
+        method = getattr(cls, name, None)
+        accessors.append(method if isinstance(method, FunctionType) else fallback)
+    
+    accessors = _FLAG_ACCESSORS[cls] = tuple(accessors)
+    return accessors
+
+def get_flag_compat(game_state, flag: str, default: Any = False) -> Any:
+    """Get flag value with compatibility for different GameState implementations"""
+    accessors = _FLAG_ACCESSORS.get(type(game_state)) or _resolve_flag_accessors(type(game_state))
+    return accessors[0](game_state, flag, default)
+
+def set_flag_compat(game_state, flag: str, value: Any = True) -> None:
+    """Set flag value with compatibility for different GameState implementations"""
+    accessors = _FLAG_ACCESSORS.get(type(game_state)) or _resolve_flag_accessors(type(game_state))
+    accessors[1](game_state, flag, value)
+
+def clear_flag_compat(game_state, flag: str) -> bool:
+    """Clear flag with compatibility for different GameState implementations"""
+    accessors = _FLAG_ACCESSORS.get(type(game_state)) or _resolve_flag_accessors(type(game_state))
+    return accessors[2](game_state, flag)
+
 # ==========================================
 # GENERIC PUZZLE PROCESSOR
 # ==========================================
@@ -88,30 +137,46 @@ class PuzzleProcessor:
         self.room_config = room_config
         self.puzzle_paths: Dict[str, Dict[str, PuzzleCommand]] = {}
         self.dynamic_handlers: Dict[str, Callable] = {}
+        # Command text -> puzzle command across all paths
+        self._command_index: Dict[str, PuzzleCommand] = {}
     
     def add_puzzle_path(self, path_name: str, commands: Dict[str, PuzzleCommand]):
         """Add a named puzzle path with its commands"""
         self.puzzle_paths[path_name] = commands
+        
+        # Rebuilt from every path so a replaced path drops its old commands.
+        # The earliest registered path wins a shared command, as it did
+        # when paths were scanned in order
+        self._command_index = {}
+        for path_commands in self.puzzle_paths.values():
+            for puzzle_cmd in path_commands.values():
+                self._command_index.setdefault(sys.intern(puzzle_cmd.command), puzzle_cmd)
+        
+        # Destinations are fixed per room, so transitions resolve up front
+        for puzzle_cmd in commands.values():
+            if puzzle_cmd.transition:
+                dest = self.room_config.destinations.get(puzzle_cmd.transition, puzzle_cmd.transition)
+                puzzle_cmd.transition_result = transition_to_room(dest, puzzle_cmd.transition_msg)
     
     def add_dynamic_handler(self, command: str, handler: Callable):
         """Add a dynamic command handler"""
         self.dynamic_handlers[command] = handler
     
-    def process_command(self, cmd: str, game_state) -> Tuple[Optional[str], Optional[List[str]]]:
+    def process_command(self, cmd: str, game_state) -> Tuple[Optional[str], Optional[Sequence[str]]]:
         """Process any puzzle command across all paths"""
         # Check all puzzle paths
-        for path_name, commands in self.puzzle_paths.items():
-            for cmd_key, puzzle_cmd in commands.items():
-                if cmd == puzzle_cmd.command:
-                    return self._handle_puzzle_command(puzzle_cmd, game_state)
+        puzzle_cmd = self._command_index.get(cmd)
+        if puzzle_cmd is not None:
+            return self._handle_puzzle_command(puzzle_cmd, game_state)
         
         # Check dynamic handlers
-        if cmd in self.dynamic_handlers:
-            return self.dynamic_handlers[cmd](game_state)
+        handler = self.dynamic_handlers.get(cmd)
+        if handler is not None:
+            return handler(game_state)
         
         return None, None
     
-    def _handle_puzzle_command(self, puzzle_cmd: PuzzleCommand, game_state) -> Tuple[Optional[str], Optional[List[str]]]:
+    def _handle_puzzle_command(self, puzzle_cmd: PuzzleCommand, game_state) -> Tuple[Optional[str], Optional[Sequence[str]]]:
         """Handle a single puzzle command"""
         # Check if it has a dynamic handler
         if puzzle_cmd.dynamic_handler:
@@ -132,8 +197,7 @@ class PuzzleProcessor:
         
         # Handle transition
         if puzzle_cmd.transition:
-            dest = self.room_config.destinations.get(puzzle_cmd.transition, puzzle_cmd.transition)
-            return transition_to_room(dest, puzzle_cmd.transition_msg)
+            return puzzle_cmd.transition_result
         
         # Return success message
         return None, puzzle_cmd.success
@@ -143,7 +207,14 @@ class PuzzleProcessor:
 # ==========================================
 
 class BaseRoom:
-    """Base class for all rooms to reduce duplication"""
+    """
+    Base class for all rooms to reduce duplication.
+    
+    Rooms use __slots__; a subclass should declare slots for any attributes
+    it adds, or its instances fall back to carrying a __dict__.
+    """
+    __slots__ = ('config', 'processor', 'command_descriptions', 'last_input',
+                 'room_id', '_entry_header', '_entry_lines')
     
     def __init__(self, room_config: RoomConfig):
         self.config = room_config
@@ -151,6 +222,10 @@ class BaseRoom:
         self.command_descriptions = []
         self.last_input = ""  # Store last input for complex parsing
         self.room_id = room_config.name.lower().replace(" ", "_")
+        # Same header format_enter_lines would build, made once per room
+        self._entry_header = _format_enter_header(room_config.name)
+        # Full entry output for when there is no hint to add
+        self._entry_lines = (self._entry_header, *room_config.entry_text, "")
         self._setup_puzzles()
     
     def _setup_puzzles(self):
@@ -159,31 +234,31 @@ class BaseRoom:
     
     def enter_room(self, game_state) -> List[str]:
         """Standard room entry with progression hints"""
-        lines = self.config.entry_text.copy()
-        
         # Add progression hint based on state
         hint = self._get_progression_hint(game_state)
         if hint:
-            lines.extend(["", hint])
+            return [self._entry_header, *self.config.entry_text, "", hint, ""]
         
-        return format_enter_lines(self.config.name, lines)
+        # A fresh list, so overrides can extend what they get from super()
+        return list(self._entry_lines)
     
     def _get_progression_hint(self, game_state) -> Optional[str]:
         """Override in subclasses for custom progression logic"""
         return None
     
-    def handle_input(self, cmd: str, game_state, room_module=None) -> Tuple[Optional[str], List[str]]:
-        """Standard input handler"""
+    def handle_input(self, cmd: str, game_state, room_module=None) -> Tuple[Optional[str], Sequence[str]]:
+        """Standard input handler; responses may be shared tuples, so treat them as read-only"""
         # Store the original input for complex parsing
         self.last_input = cmd
         
+        # Normalize once for every handler below
+        cmd = cmd.lower().strip()
+        
         # Check standard commands first (including global restart)
-        handled, response = standard_commands(cmd, game_state, room_module)
+        handled, response = standard_commands(cmd, game_state, room_module, normalized=True)
         if handled:
             return None, response
         
-        cmd = cmd.lower().strip()
-        
         # Let subclass handle specific commands first
         transition, response = self._handle_specific_input(cmd, game_state)
         if response is not None:
@@ -196,7 +271,7 @@ class BaseRoom:
         
         return None, [">> Unknown command. Try 'help' for available options."]
     
-    def _handle_specific_input(self, cmd: str, game_state) -> Tuple[Optional[str], Optional[List[str]]]:
+    def _handle_specific_input(self, cmd: str, game_state) -> Tuple[Optional[str], Optional[Sequence[str]]]:
         """Override in subclasses for room-specific commands"""
         return None, None
     
@@ -208,14 +283,26 @@ class BaseRoom:
 # UTILITY FUNCTIONS
 # ==========================================
 
+@lru_cache(maxsize=64)
+def _format_enter_header(title: str) -> str:
+    """Format a room entry header; titles are fixed per room, so this is cached"""
+    return f"\n=== {title.upper()} ==="
+
 def format_enter_lines(title: str, body_lines: List[str]) -> List[str]:
     """Format room entry text"""
     return [
-        f"\n=== {title.upper()} ===",
+        _format_enter_header(title),
         *body_lines,
         ""
     ]
 
+def matches_command(cmd: str, command: str) -> bool:
+    """Check if cmd is command itself or command followed by arguments"""
+    # Checking the space in place avoids building command + " " per call
+    return cmd.startswith(command) and (
+        len(cmd) == len(command) or cmd.startswith(" ", len(command))
+    )
+
 def transition_to_room(new_room: str, transition_msg: List[str] = None) -> Tuple[str, List[str]]:
     """Transition to a new room with optional message"""
     if transition_msg:
@@ -237,40 +324,60 @@ def describe_flags(game_state, prefix: str = "") -> List[str]:
 # RESTART FUNCTIONALITY
 # ==========================================
 
-def handle_restart_command(cmd: str, game_state) -> Tuple[bool, Optional[List[str]]]:
+# Restart responses, also used by the game engine's own restart handling
+GAME_RESET_TEXT = (
+    "=== GAME RESET COMPLETE ===",
+    "All progress has been erased.",
+    "Starting from the beginning...",
+    ""
+)
+
+RESTART_OPTIONS_TEXT = (
+    "=== RESTART OPTIONS ===",
+    "restart room     - Reset current room puzzles",
+    "restart game     - Reset entire game to beginning",
+    "restart confirm  - Confirm full game reset",
+    "",
+    "Note: 'restart room' keeps your inventory and progress in other rooms"
+)
+
+RESTART_WARNING_TEXT = (
+    "=== WARNING ===",
+    "This will reset ALL progress, inventory, and flags!",
+    "Type 'restart confirm' to proceed, or any other command to cancel."
+)
+
+# Flag name fragments treated as room-specific by "restart room"
+ROOM_FLAG_PATTERNS = (
+    'terminal_accessed', 'password_entered', 'puzzle_solved',
+    'door_opened', 'item_found', 'sequence_complete',
+    '_examined', '_unlocked', '_activated', '_discovered'
+)
+
+# All patterns as one alternation, so each flag is searched once in C
+ROOM_FLAG_RE = re.compile("|".join(map(re.escape, ROOM_FLAG_PATTERNS)))
+
+def handle_restart_command(cmd: str, game_state) -> Tuple[bool, Optional[Sequence[str]]]:
     """
     Handle restart commands globally across all rooms.
-    Returns (handled, response) tuple.
+    Returns (handled, response) tuple; fixed responses are shared tuples.
     """
-    parts = cmd.split()
+    # Nearly every input is not a restart; reject those without splitting
+    if not cmd.startswith(('restart', 'reset')):
+        return False, None
+    
+    parts = cmd.split(maxsplit=2)
     
-    if parts[0] not in ['restart', 'reset']:
+    if parts[0] not in ('restart', 'reset'):
         return False, None
     
     if len(parts) == 1:
         # Just "restart" or "reset" - show options
-        return True, [
-            "=== RESTART OPTIONS ===",
-            "restart room     - Reset current room puzzles",
-            "restart game     - Reset entire game to beginning",
-            "restart confirm  - Confirm full game reset",
-            "",
-            "Note: 'restart room' keeps your inventory and progress in other rooms"
-        ]
-    
-    if len(parts) >= 2:
-        option = parts[1]
-        
-        if option == "room":
-            return True, restart_current_room(game_state)
-        elif option == "game":
-            return True, [
-                "=== WARNING ===",
-                "This will reset ALL progress, inventory, and flags!",
-                "Type 'restart confirm' to proceed, or any other command to cancel."
-            ]
-        elif option == "confirm":
-            return True, restart_entire_game(game_state)
+        return True, list(RESTART_OPTIONS_TEXT)
+    
+    handler = RESTART_SUBCOMMANDS.get(parts[1])
+    if handler is not None:
+        return True, handler(game_state)
     
     return True, ["Invalid restart command. Type 'restart' for options."]
 
@@ -281,27 +388,17 @@ def restart_current_room(game_state) -> List[str]:
     # Handle both possible attribute names for flags
     flags_dict = getattr(game_state, 'flags', None) or getattr(game_state, 'game_flags', {})
     
-    # Get all flags to clear
-    flags_to_clear = []
-    for flag in list(flags_dict.keys()):
-        # Clear flags that contain the room name or are likely room-specific
-        if (current_room in flag or 
-            flag.startswith(current_room) or
-            flag.endswith(f"_{current_room}") or
-            # Also clear common room-specific patterns
-            any(pattern in flag for pattern in [
-                'terminal_accessed', 'password_entered', 'puzzle_solved',
-                'door_opened', 'item_found', 'sequence_complete',
-                '_examined', '_unlocked', '_activated', '_discovered'
-            ])):
-            flags_to_clear.append(flag)
-    
-    # Clear the flags
+    # Clear flags that contain the room name (which covers the prefix and
+    # suffix forms) or match a common room-specific pattern
+    flags_to_clear = [
+        flag for flag in flags_dict
+        if current_room in flag
+        or ROOM_FLAG_RE.search(flag)
+    ]
+    
+    # Clear the flags from the same dict they were found in
     for flag in flags_to_clear:
-        if hasattr(game_state, 'flags'):
-            del game_state.flags[flag]
-        else:
-            del game_state.game_flags[flag]
+        del flags_dict[flag]
     
     lines = [
         f"=== RESTARTING ROOM: {current_room.upper()} ===",
@@ -315,10 +412,11 @@ def restart_current_room(game_state) -> List[str]:
 def restart_entire_game(game_state) -> List[str]:
     """Reset the entire game to initial state."""
     # Clear all flags - handle both possible attribute names
-    if hasattr(game_state, 'flags'):
-        game_state.flags.clear()
-    elif hasattr(game_state, 'game_flags'):
-        game_state.game_flags.clear()
+    flags_dict = getattr(game_state, 'flags', None)
+    if flags_dict is None:
+        flags_dict = getattr(game_state, 'game_flags', None)
+    if flags_dict is not None:
+        flags_dict.clear()
     
     # Clear inventory
     game_state.inventory.clear()
@@ -330,77 +428,106 @@ def restart_entire_game(game_state) -> List[str]:
         game_state.health = 100
     
     # Clear any custom game state variables
-    if hasattr(game_state, 'variables'):
-        game_state.variables.clear()
+    variables = getattr(game_state, 'variables', None)
+    if variables is not None:
+        variables.clear()
     
     # Reset to starting room
-    starting_room = 'boot' if hasattr(game_state, 'current_room') else 'start'
     if hasattr(game_state, 'current_room'):
-        game_state.current_room = starting_room
+        game_state.current_room = 'boot'
     
-    lines = [
-        "=== GAME RESET COMPLETE ===",
-        "All progress has been erased.",
-        "Starting from the beginning...",
-        ""
-    ]
-    
-    return lines
+    return list(GAME_RESET_TEXT)
+
+# Second word of a restart command -> handler
+RESTART_SUBCOMMANDS: Dict[str, Callable] = {
+    "room": restart_current_room,
+    "game": lambda gs: list(RESTART_WARNING_TEXT),
+    "confirm": restart_entire_game,
+}
 
 # ==========================================
 # STANDARD COMMANDS
 # ==========================================
 
+# Command -> fixed response tuple, or a handler taking the game state
 GLOBAL_COMMANDS = {
-    "look": lambda gs: [">> You scan the area... but nothing changes."],
-    "observe": lambda gs: [">> You observe carefully, but nothing new stands out."],
-    "scan": lambda gs: [">> You run a basic scan, but no anomalies are found."],
+    "look": (">> You scan the area... but nothing changes.",),
+    "observe": (">> You observe carefully, but nothing new stands out.",),
+    "scan": (">> You run a basic scan, but no anomalies are found.",),
     "inventory": print_inventory,
     "inv": print_inventory,
     "i": print_inventory,
-    "flags": lambda gs: describe_flags(gs),
+    "flags": describe_flags,
     "status": lambda gs: [
         ">> STATUS:",
-        f"   Current Room: {gs.current_room if hasattr(gs, 'current_room') else 'unknown'}",
+        f"   Current Room: {getattr(gs, 'current_room', 'unknown')}",
         f"   Inventory: {', '.join(gs.inventory) if gs.inventory else 'empty'}",
         f"   Score: {getattr(gs, 'score', 0)}",
         f"   Health: {getattr(gs, 'health', 100)}"
     ],
 }
 
-def standard_commands(cmd: str, game_state, room_module=None) -> Tuple[bool, Optional[List[str]]]:
-    """Process standard/global commands"""
-    cmd = cmd.strip().lower()
+STANDARD_HELP_TEXT = (
+    ">> Universal commands:",
+    "  look / scan / observe - examine your surroundings",
+    "  inventory / i         - view held items",
+    "  status                - view current game status",
+    "  restart               - restart options (room/game)",
+    "  flags                 - list game flags (debug)",
+    "  help                  - show this help menu"
+)
+
+# Room command list -> complete help text
+_HELP_CACHE: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# First words of every command standard_commands can handle
+STANDARD_FIRST_WORDS = frozenset(GLOBAL_COMMANDS).union(("help", "restart", "reset"))
+
+def standard_commands(cmd: str, game_state, room_module=None,
+                      normalized: bool = False) -> Tuple[bool, Optional[Sequence[str]]]:
+    """
+    Process standard/global commands; pass normalized=True if cmd is already stripped and lowercase.
+    
+    Fixed responses are shared tuples, so copy the lines before modifying them.
+    """
+    if not normalized:
+        cmd = cmd.strip().lower()
+    
+    # Room-specific commands are the common case; let them through untouched
+    if cmd.partition(" ")[0] not in STANDARD_FIRST_WORDS:
+        return False, None
     
     # Check restart commands first
     handled, response = handle_restart_command(cmd, game_state)
     if handled:
         return True, response
 
-    if cmd in GLOBAL_COMMANDS:
-        return True, GLOBAL_COMMANDS[cmd](game_state)
+    handler = GLOBAL_COMMANDS.get(cmd)
+    if handler is not None:
+        # Fixed responses are returned as-is; nothing needs to run
+        if type(handler) is tuple:
+            return True, handler
+        return True, handler(game_state)
 
     if cmd == "help":
-        help_lines = [
-            ">> Universal commands:",
-            "  look / scan / observe - examine your surroundings",
-            "  inventory / i         - view held items",
-            "  status                - view current game status",
-            "  restart               - restart options (room/game)",
-            "  flags                 - list game flags (debug)",
-            "  help                  - show this help menu"
-        ]
+        get_available_commands = getattr(room_module, "get_available_commands", None)
+        room_cmds = tuple(get_available_commands() or ()) if get_available_commands else ()
         
-        if room_module and hasattr(room_module, "get_available_commands"):
-            room_cmds = room_module.get_available_commands()
+        # Keyed by the room's commands rather than the module, so a room whose
+        # command list changes simply gets a new entry. Every caller gets the
+        # same cached tuple back, not a fresh list
+        help_text = _HELP_CACHE.get(room_cmds)
+        if help_text is None:
+            help_text = STANDARD_HELP_TEXT
             if room_cmds:
-                help_lines.extend([
+                help_text += (
                     "",
                     ">> Room-specific commands:",
                     *[f"  {c}" for c in room_cmds]
-                ])
+                )
+            _HELP_CACHE[room_cmds] = help_text
         
-        return True, help_lines
+        return True, help_text
 
     return False, None
 
@@ -410,25 +537,29 @@ def standard_commands(cmd: str, game_state, room_module=None) -> Tuple[bool, Opt
 
 class TimedPuzzleRoom(BaseRoom):
     """Base for rooms with timing-based puzzles"""
+    __slots__ = ('timing_config', 'sequence_state_key')
     
     def __init__(self, room_config: RoomConfig, timing_config: Dict[str, Any]):
         self.timing_config = timing_config
         super().__init__(room_config)
+        self.sequence_state_key = f"{self.room_id}_sequence_state"
     
     def initialize_sequence_state(self, game_state):
         """Initialize timing sequence state"""
-        state_key = f"{self.config.name.lower().replace(' ', '_')}_sequence_state"
-        if not game_state.get(state_key):
-            game_state.set(state_key, {
+        state = game_state.get(self.sequence_state_key)
+        if not state:
+            state = {
                 "active": False,
                 "current_step": 0,
                 "last_action_time": 0,
                 "sequence_start_time": 0
-            })
-        return game_state.get(state_key)
+            }
+            game_state.set(self.sequence_state_key, state)
+        return state
 
 class GridNavigationRoom(BaseRoom):
     """Base for rooms with grid/network navigation"""
+    __slots__ = ('grid_config',)
     
     def __init__(self, room_config: RoomConfig, grid_config: Dict[str, Any]):
         self.grid_config = grid_config
@@ -444,6 +575,7 @@ class GridNavigationRoom(BaseRoom):
 
 class MemoryPuzzleRoom(BaseRoom):
     """Base for rooms with memory/pattern puzzles"""
+    __slots__ = ('memory_config',)
     
     def __init__(self, room_config: RoomConfig, memory_config: Dict[str, Any]):
         self.memory_config = memory_config
@@ -485,9 +617,9 @@ def process_puzzle_command(cmd, game_state, puzzle_config):
     Legacy processor for puzzle commands.
     Kept for backwards compatibility with dictionary-based rooms.
     """
-    for action_key, action in puzzle_config.items():
+    for action in puzzle_config.values():
         # Check if this is the right command
-        if cmd == action["command"] or cmd.startswith(action["command"] + " "):
+        if matches_command(cmd, action["command"]):
             
             # Handle dynamic responses (custom logic)
             if action.get("dynamic_response"):
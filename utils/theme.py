@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 class Theme(Enum):
     WHITE_BOOT = "white_boot"
@@ -7,36 +8,42 @@ class Theme(Enum):
     CYBER_RED = "cyber_red"
 
 class ThemeColors:
-    """Color palettes for each theme."""
+    """Color palettes for each theme; they are shared, so they are read-only."""
     
-    WHITE_BOOT = {
+    WHITE_BOOT = MappingProxyType({
         'bg': (245, 245, 245),
         'text': (20, 20, 20),
         'terminal_bg': (255, 255, 255, 230),
         'terminal_border': (180, 180, 180),
         'terminal_text': (0, 0, 0),
-    }
+    })
     
-    MATRIX_BLUE = {
+    MATRIX_BLUE = MappingProxyType({
         'bg': (0, 0, 0),
         'text': (100, 200, 255),
         'terminal_bg': (10, 15, 25, 180),
         'terminal_border': (80, 150, 220),
         'terminal_text': (150, 220, 255),
-    }
+    })
     
-    CYBER_RED = {
+    CYBER_RED = MappingProxyType({
         'bg': (15, 0, 0),
         'text': (255, 68, 68),
         'terminal_bg': (30, 10, 10, 200),
         'terminal_border': (200, 50, 50),
         'terminal_text': (255, 100, 100),
-    }
+    })
+
+    # Theme -> palette, filled in once below the class
+    _PALETTES: Dict[Theme, Mapping[str, Tuple[int, ...]]] = {}
 
     @classmethod
-    def get_palette(cls, theme: Theme) -> Dict[str, Tuple[int, ...]]:
-        return {
-            Theme.WHITE_BOOT: cls.WHITE_BOOT,
-            Theme.MATRIX_BLUE: cls.MATRIX_BLUE,
-            Theme.CYBER_RED: cls.CYBER_RED,
-        }.get(theme, cls.MATRIX_BLUE)
+    def get_palette(cls, theme: Theme) -> Mapping[str, Tuple[int, ...]]:
+        return cls._PALETTES.get(theme, cls.MATRIX_BLUE)
+
+
+ThemeColors._PALETTES.update({
+    Theme.WHITE_BOOT: ThemeColors.WHITE_BOOT,
+    Theme.MATRIX_BLUE: ThemeColors.MATRIX_BLUE,
+    Theme.CYBER_RED: ThemeColors.CYBER_RED,
+})